@@ -1,234 +1,425 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
-from functools import lru_cache
+import time
+from array import array
+from collections import ChainMap, namedtuple
+
+try:
+    # C-backed parser, noticeably faster on the multi-MB recipe file
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # --------------------------------------------------------------------
 # LOCAL DATA LOADER
 # --------------------------------------------------------------------
+DATA_FILES = ("item.json", "wearable.json", "consumable.json", "recipe.json")
+READ_ATTEMPTS = 3
+
+
+def file_stat(path):
+    """Return (mtime, size) for path, or (None, None) if it can't be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None, None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def data_signature():
+    """Return (filename, mtime, size) for every local data file."""
+    return tuple(
+        (filename, *file_stat(os.path.join("data", filename)))
+        for filename in DATA_FILES
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def loaded_data_signature():
+    """Signature of the data files the cached loaders were built from."""
+    return data_signature()
+
 
 def load_local_json(filename):
-    """Load a JSON file from the local /data folder."""
+    """Load a JSON file from the local /data folder.
+
+    Not cached itself: only the cached loaders below call it, and caching
+    here would keep a second, pickled copy of every file in memory.
+
+    A decode error is retried only while the file keeps changing (it is
+    being replaced); missing or malformed files fail straight away. The
+    callers then cache an empty result until data_signature() changes.
+    """
     path = os.path.join("data", filename)
-    try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        st.error(f"Error loading {filename}: {e}")
-        return None
+    for attempt in range(READ_ATTEMPTS):
+        before = file_stat(path)
+        try:
+            # Read a private copy: a file rewritten in place mid-parse then
+            # fails to decode instead of faulting on vanished pages
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+        except ValueError as e:  # JSONDecodeError, for orjson and json alike
+            error = e
+            if attempt + 1 < READ_ATTEMPTS and file_stat(path) != before:
+                time.sleep(0.1 * 2 ** attempt)
+                continue
+        except Exception as e:
+            error = e
+        break
+
+    st.error(f"Error loading {filename}: {error}")
+    return None
 
 
-@lru_cache(maxsize=None)
-def load_items():
-    """Load items + wearables + consumables into a single dict."""
-    items = {}
+# Only the fields the app reads are kept in memory
+ITEM_FIELDS = ("id", "name", "iconPath", "tier", "itemLevel", "categoryIds")
+RECIPE_FIELDS = ("id", "name", "outputs", "itemIngredients", "skillRequired", "skillDifficulty")
 
-    # Base items
-    base_items = load_local_json("item.json")
-    if base_items:
-        for entry in base_items:
-            items[entry["id"]] = entry
 
-    # Wearables
-    wearables = load_local_json("wearable.json")
-    if wearables:
-        for w in wearables:
-            items[w["id"]] = w
+def project(entry, fields, ids=None):
+    """Return a copy of entry holding only the given fields.
 
-    # Consumables
-    consumables = load_local_json("consumable.json")
-    if consumables:
-        for c in consumables:
-            items[c["id"]] = c
+    With an id table (see id_table()), the "id" field is interned in it.
+    """
+    projected = {k: entry[k] for k in fields if k in entry}
+    if ids is not None and "id" in projected:
+        projected["id"] = intern_id(projected["id"], ids)
+    return projected
 
-    return items
 
+@st.cache_resource(show_spinner=False)
+def id_table():
+    """Canonical copy of every item/recipe id string seen while loading."""
+    return {}
 
-@lru_cache(maxsize=None)
-def load_recipes():
-    data = load_local_json("recipe.json")
-    return {entry["id"]: entry for entry in data} if data else {}
 
+def intern_id(item_id, ids):
+    """Return the canonical copy of item_id from the ids table.
 
-# --------------------------------------------------------------------
-# CRAFTABLE INDEX
-# --------------------------------------------------------------------
-@lru_cache(maxsize=None)
-def craftable_index():
-    """Map output_item_id → recipe_id"""
-    index = {}
-    for recipe_id, recipe in load_recipes().items():
-        for out in recipe.get("outputs", []):
-            index[out["entity"]["id"]] = recipe_id
-    return index
+    The same id is repeated across items, recipe outputs and ingredients;
+    sharing one string object saves memory and lets index lookups match
+    keys by identity instead of comparing characters.
+    """
+    if not isinstance(item_id, str):
+        return item_id
+    return ids.setdefault(item_id, item_id)
 
 
-# --------------------------------------------------------------------
-# SPECIAL CASE: Sand → do NOT recurse into Limestone
-# --------------------------------------------------------------------
-def is_sand_item(item_id, items):
-    return "sand" in items.get(item_id, {}).get("name", "").lower()
+# Recipe outputs/ingredients, flattened from {"entity": {...}, "count": n}
+ItemStack = namedtuple("ItemStack", ("id", "name", "count"))
 
-def is_charcoal_item(item_id, items):
-    return "charcoal" in items.get(item_id, {}).get("name", "").lower()
 
-# --------------------------------------------------------------------
-# RAW MATERIAL RESOLVER
-# --------------------------------------------------------------------
-def resolve(item_id, items, recipes, visited=None, needed=1):
-    """Return raw materials for item_id, guaranteed to return a dict."""
-    if visited is None:
-        visited = set()
+def project_item(entry, ids):
+    return project(entry, ITEM_FIELDS, ids)
 
-    # Prevent loops
-    if item_id in visited:
-        return {}
-    visited.add(item_id)
 
-    # Terminal materials (stop recursion entirely)
-    if is_sand_item(item_id, items) or is_charcoal_item(item_id, items):
-        return {item_id: needed}
+def project_stack(stack, ids):
+    entity = stack.get("entity", {})
+    return ItemStack(intern_id(entity.get("id"), ids), entity.get("name"), stack.get("count", 1))
 
-    craft_index = craftable_index()
 
-    # Not craftable → raw item
-    if item_id not in craft_index:
-        return {item_id: needed}
+def project_recipe(entry, ids):
+    recipe = project(entry, RECIPE_FIELDS, ids)
 
-    recipe = recipes.get(craft_index[item_id])
-    if not recipe:
-        # SAFETY: bad or missing recipe
-        return {item_id: needed}
+    # Outputs/ingredients embed full entities: keep id, name and count only
+    for key in ("outputs", "itemIngredients"):
+        if key in recipe:
+            recipe[key] = [project_stack(stack, ids) for stack in recipe[key]]
 
-    outputs = recipe.get("outputs", [])
-    if not outputs:
-        # SAFETY: corrupt recipe with no outputs
-        return {item_id: needed}
+    if isinstance(recipe.get("skillRequired"), dict):
+        recipe["skillRequired"] = project(recipe["skillRequired"], ("name",))
 
-    output_stack = outputs[0].get("count", 1)
-    crafts_needed = (needed + output_stack - 1) // output_stack
+    return recipe
 
-    breakdown = {}
 
-    for ing in recipe.get("itemIngredients", []):
-        ing_id = ing["entity"]["id"]
-        qty_per_craft = ing["count"]
-        sub_needed = qty_per_craft * crafts_needed
+def load_entities(filename):
+    data = load_local_json(filename)
+    ids = id_table()
+    items = (project_item(entry, ids) for entry in data or ())
+    return {item["id"]: item for item in items}
 
-        sub_tree = resolve(
-            ing_id, items, recipes,
-            visited=visited.copy(),
-            needed=sub_needed
-        )
 
-        # ——— SAFETY: enforce dict ———
-        if not isinstance(sub_tree, dict):
-            sub_tree = {}
-        # ————————————————
+@st.cache_resource(show_spinner=False)
+def load_base_items():
+    return load_entities("item.json")
 
-        for mat, qty in sub_tree.items():
-            breakdown[mat] = breakdown.get(mat, 0) + qty
 
-    return breakdown
+@st.cache_resource(show_spinner=False)
+def load_wearables():
+    return load_entities("wearable.json")
 
 
+@st.cache_resource(show_spinner=False)
+def load_consumables():
+    return load_entities("consumable.json")
+
+
+@st.cache_resource(show_spinner=False)
+def load_items():
+    """Items + wearables + consumables as a single mapping.
+
+    A ChainMap over the three cached loaders instead of a merged copy;
+    consumables win over wearables, which win over base items.
+    """
+    return ChainMap(load_consumables(), load_wearables(), load_base_items())
+
+
+@st.cache_resource(show_spinner=False)
+def load_recipes():
+    data = load_local_json("recipe.json")
+    ids = id_table()
+    recipes = (project_recipe(entry, ids) for entry in data or ())
+    return {recipe["id"]: recipe for recipe in recipes}
+
 
 # --------------------------------------------------------------------
-# INTERMEDIATE CRAFTABLE RESOLVER
+# CRAFTABLE INDEX
 # --------------------------------------------------------------------
-def resolve_craftables(item_id, items, recipes, visited=None, needed=1, is_root=True):
-    """Return craftable intermediates for item_id. Guaranteed safe return of dict."""
-    if visited is None:
-        visited = set()
+@st.cache_resource(show_spinner=False)
+def craftable_index():
+    """Map output_item_id → recipe_id"""
+    index = {}
+    for recipe_id, recipe in load_recipes().items():
+        for out in recipe.get("outputs", []):
+            index[out.id] = recipe_id
+    return index
 
-    # Prevent recursion loops
-    if item_id in visited:
-        return {}
-    visited.add(item_id)
 
-    # Terminal materials: do not recurse
-    if is_sand_item(item_id, items) or is_charcoal_item(item_id, items):
-        return {}
+@st.cache_resource(show_spinner=False)
+def item_name_index():
+    """Map item name → item (first match wins)"""
+    index = {}
+    for item in load_items().values():
+        index.setdefault(item["name"], item)
+    return index
 
-    craft_index = craftable_index()
 
-    # Raw materials never produce intermediates
-    if item_id not in craft_index:
-        return {}
+@st.cache_resource(show_spinner=False)
+def output_name_index():
+    """Map output item name → output_item_id"""
+    index = {}
+    for recipe in load_recipes().values():
+        for out in recipe.get("outputs", []):
+            index[out.name] = out.id
+    return index
 
-    # How many crafts needed?
-    recipe_id = craft_index.get(item_id)
-    recipe = recipes.get(recipe_id)
-    if not recipe:
-        return {}
 
-    outputs = recipe.get("outputs", [])
-    if not outputs:
-        return {}
+@st.cache_resource(show_spinner=False)
+def craftable_names():
+    """Sorted names of every recipe output, as a tuple shared by every session"""
+    return tuple(sorted(output_name_index()))
 
-    output_stack = outputs[0].get("count", 1)
-    crafts_needed = (needed + output_stack - 1) // output_stack
 
-    # If craftable and not root, this item *is* an intermediate
-    if not is_root:
-        return {item_id: crafts_needed}
+@st.cache_resource(show_spinner=False)
+def ingredient_graph():
+    """Map output_item_id → (output_stack, ((ingredient_id, qty_per_craft), ...))"""
+    recipes = load_recipes()
+    graph = {}
+    for item_id, recipe_id in craftable_index().items():
+        recipe = recipes.get(recipe_id)
+        # SAFETY: bad recipes or recipes without outputs behave as raw items
+        if not recipe or not recipe.get("outputs"):
+            continue
 
-    breakdown = {}
+        ingredients = tuple(
+            (ing.id, ing.count)
+            for ing in recipe.get("itemIngredients", [])
+            if ing.id
+        )
+        graph[item_id] = (recipe["outputs"][0].count, ingredients)
+    return graph
 
-    # Process ingredient list safely
-    for ing in recipe.get("itemIngredients", []):
-        entity = ing.get("entity", {})
-        ing_id = entity.get("id")
-        qty_per_craft = ing.get("count", 1)
 
-        # Safety: missing ID
-        if not ing_id:
+# --------------------------------------------------------------------
+# SPECIAL CASE: Sand → do NOT recurse into Limestone
+# --------------------------------------------------------------------
+def name_contains(item, word):
+    return word in item.get("name", "").lower()
+
+
+@st.cache_resource(show_spinner=False)
+def terminal_item_ids():
+    """Ids of items that are never broken down further (sand, charcoal)"""
+    return frozenset(
+        item_id for item_id, item in load_items().items()
+        if name_contains(item, "sand") or name_contains(item, "charcoal")
+    )
+
+# --------------------------------------------------------------------
+# RECIPE GRAPH (flat arrays, indexed by dense item index)
+# --------------------------------------------------------------------
+RecipeGraph = namedtuple(
+    "RecipeGraph",
+    ("ids", "index", "offsets", "children", "counts", "output_stack", "expands"),
+)
+
+
+@st.cache_resource(show_spinner=False)
+def build_graph():
+    """Pack ingredient_graph() into CSR-style arrays.
+
+    ids[i] / index[item_id] map between item ids and dense indices.
+    Ingredients of node i are children[j] x counts[j] for j in
+    offsets[i]:offsets[i + 1]. expands[i] is 1 for craftable, non-terminal
+    nodes; everything else resolves to itself as a raw material.
+    """
+    graph = ingredient_graph()
+    terminal = terminal_item_ids()
+
+    ids = list(graph)
+    index = {item_id: i for i, item_id in enumerate(ids)}
+    for _, ingredients in graph.values():
+        for ing_id, _ in ingredients:
+            if ing_id not in index:
+                index[ing_id] = len(ids)
+                ids.append(ing_id)
+
+    offsets = array("i", [0])
+    children = array("i")
+    counts = array("i")
+    output_stack = array("i", [1] * len(ids))
+    expands = bytearray(len(ids))
+
+    for i, item_id in enumerate(ids):
+        if item_id in graph:
+            stack_size, ingredients = graph[item_id]
+            output_stack[i] = stack_size
+            expands[i] = item_id not in terminal
+            for ing_id, qty_per_craft in ingredients:
+                children.append(index[ing_id])
+                counts.append(qty_per_craft)
+        offsets.append(len(children))
+
+    return RecipeGraph(ids, index, offsets, children, counts, output_stack, expands)
+
+
+def craft_order(root, offsets, children, expands):
+    """Order the nodes reachable from root so parents come before ingredients.
+
+    Returns (order, back_edges). An iterative DFS from root lists nodes in
+    reverse finishing order; an edge leading back onto the current DFS
+    path closes a loop and goes into back_edges instead, the same edges the
+    old per-path visited set refused to follow.
+    """
+    on_path = {root: True}  # node → still on the current path
+    finished = []
+    back_edges = set()
+    stack = [(root, offsets[root])]
+    while stack:
+        node, edge = stack[-1]
+        # Terminal materials and raw items stop the expansion entirely
+        if edge == offsets[node + 1] or not expands[node]:
+            stack.pop()
+            on_path[node] = False
+            finished.append(node)
             continue
+        stack[-1] = (node, edge + 1)
+        child = children[edge]
+        if child not in on_path:
+            on_path[child] = True
+            stack.append((child, offsets[child]))
+        elif on_path[child]:
+            back_edges.add(edge)
 
-        sub_needed = qty_per_craft * crafts_needed
+    finished.reverse()
+    return finished, back_edges
 
-        sub_tree = resolve_craftables(
-            ing_id, items, recipes,
-            visited=visited.copy(),
-            needed=sub_needed,
-            is_root=False
-        )
 
-        # ——— SAFETY PATCH ———
-        if not isinstance(sub_tree, dict):
-            sub_tree = {}
-        # ————————————————
+# --------------------------------------------------------------------
+# CRAFTING RESOLVER
+# --------------------------------------------------------------------
+# One entry per (item_id, needed); least recently used ones are evicted
+WALK_CACHE_ENTRIES = 1_000
+
+
+@st.cache_data(show_spinner=False, max_entries=WALK_CACHE_ENTRIES)
+def walk(item_id, needed=1):
+    """Return (raw materials, craftable intermediates) for item_id.
+
+    Demand for each item is pooled over every recipe that uses it before
+    rounding up to whole crafts, so an ingredient shared by several
+    sub-recipes is only rounded once. Cached on (item_id, needed); the
+    data comes from the cached loaders.
+    """
+    graph = build_graph()
+    root = graph.index.get(item_id)
+    if root is None:
+        # Not part of any recipe → raw item
+        return {item_id: needed}, {}
+
+    offsets = graph.offsets
+    children = graph.children
+    counts = graph.counts
+    output_stack = graph.output_stack
+    expands = graph.expands
+
+    # Every parent comes before its ingredients, so a node's total demand
+    # is known by the time it is reached
+    order, back_edges = craft_order(root, offsets, children, expands)
+    demand = dict.fromkeys(order, 0)
+    demand[root] = needed
+    crafts = {}
+    for node in order:
+        if not expands[node]:
+            continue
+
+        crafts_needed = (demand[node] + output_stack[node] - 1) // output_stack[node]
+        crafts[node] = crafts_needed
+        for edge in range(offsets[node], offsets[node + 1]):
+            if edge not in back_edges:
+                demand[children[edge]] += counts[edge] * crafts_needed
 
-        for mat, qty in sub_tree.items():
-            breakdown[mat] = breakdown.get(mat, 0) + qty
+    raw = {graph.ids[node]: qty for node, qty in demand.items() if not expands[node]}
 
-    return breakdown
+    # Every craft below the root is an intermediate, with its pooled count
+    craftables = {graph.ids[node]: qty for node, qty in crafts.items() if node != root}
+    return raw, craftables
 
 
 
 # --------------------------------------------------------------------
 # TREE RENDER
 # --------------------------------------------------------------------
-def render_tree(item_id, recipes, indent=0):
+@st.cache_data(show_spinner=False)
+def render_tree(item_id):
+    """Render the crafting tree for item_id. Cached on item_id.
+
+    Walks the tree with an explicit stack; an item that is already on the
+    current path is marked as a loop instead of being expanded again.
+    """
+    recipes = load_recipes()
     craft_index = craftable_index()
-    spacer = "  " * indent
-
-    if item_id not in craft_index:
-        return f"{spacer}- {item_id} (raw)\n"
-
-    recipe = recipes[craft_index[item_id]]
-    s = f"{spacer}- {recipe['name']}\n"
+    lines = []
+    on_path = set()
+
+    # (item_id, spacer, ingredient line) to expand; a None spacer marks
+    # the point where item_id's subtree is finished
+    stack = [(item_id, "", None)]
+    while stack:
+        item_id, spacer, header = stack.pop()
+        if spacer is None:
+            on_path.discard(item_id)
+            continue
+        if header:
+            lines.append(header)
 
-    for ing in recipe["itemIngredients"]:
-        name = ing["entity"]["name"]
-        qty = ing["count"]
-        sub_id = ing["entity"]["id"]
+        if item_id not in craft_index:
+            lines.append(f"{spacer}- {item_id} (raw)\n")
+            continue
+        if item_id in on_path:
+            lines.append(f"{spacer}- {item_id} (loop)\n")
+            continue
 
-        s += f"{spacer}  {name} x{qty}\n"
-        s += render_tree(sub_id, recipes, indent + 2)
+        recipe = recipes[craft_index[item_id]]
+        lines.append(f"{spacer}- {recipe['name']}\n")
 
-    return s
+        on_path.add(item_id)
+        stack.append((item_id, None, None))
+        child_spacer = spacer + "    "
+        for sub_id, name, qty in reversed(recipe["itemIngredients"]):
+            stack.append((sub_id, child_spacer, f"{spacer}  {name} x{qty}\n"))
+    return "".join(lines)
 
 
 # --------------------------------------------------------------------
@@ -252,43 +443,44 @@ def get_item_emoji(item):
     return "📦"
 
 
-def prettify_breakdown(breakdown, items):
-    pretty = {}
-    for item_id, qty in breakdown.items():
-        item = items[item_id]
-        pretty[f"{get_item_emoji(item)} {item['name']}"] = qty
-    return dict(sorted(pretty.items()))
+@st.cache_resource(show_spinner=False)
+def display_name_index():
+    """Map item_id → "emoji name" display string"""
+    return {
+        item_id: f"{get_item_emoji(item)} {item['name']}"
+        for item_id, item in load_items().items()
+    }
 
 
-def get_item_by_name(name, items):
-    for i in items.values():
-        if i["name"] == name:
-            return i
-    return None
+def get_item_by_name(name):
+    return item_name_index().get(name)
 
 
 def get_icon_url(item):
     return "https://paxdei.gaming.tools" + item["iconPath"].replace("{height}", "128")
 
 
-def get_recipe_crafting_info(item_id, recipes):
-    craft_index = craftable_index()
-    recipe_id = craft_index.get(item_id)
-    if not recipe_id:
-        return None
-
-    recipe = recipes[recipe_id]
+def recipe_crafting_info(recipe):
     skill = recipe.get("skillRequired", {}).get("name", "Unknown")
     level = recipe.get("skillDifficulty", "N/A")
     return {"skill": skill, "level": level}
 
-def get_output_count(item_id, recipes):
-    craft_index = craftable_index()
-    recipe_id = craft_index.get(item_id)
-    if not recipe_id:
-        return 1  # raw material, no output stack
-    recipe = recipes[recipe_id]
-    return recipe["outputs"][0].get("count", 1)
+
+@st.cache_resource(show_spinner=False)
+def item_display_table():
+    """DataFrame indexed by item_id with the display name of every item"""
+    return pd.Series(display_name_index(), name="Item").to_frame()
+
+
+@st.cache_resource(show_spinner=False)
+def crafting_info_table():
+    """DataFrame indexed by output_item_id with the skill and level of its recipe"""
+    recipes = load_recipes()
+    rows = {}
+    for item_id, recipe_id in craftable_index().items():
+        info = recipe_crafting_info(recipes[recipe_id])
+        rows[item_id] = {"Skill": info["skill"], "Required Level": info["level"]}
+    return pd.DataFrame.from_dict(rows, orient="index")
 
 
 
@@ -297,19 +489,20 @@ def get_output_count(item_id, recipes):
 # --------------------------------------------------------------------
 st.title("🧪 Pax Dei Crafting Calculator")
 
-items = load_items()
+# Data files were replaced on disk → drop every derived cache
+if loaded_data_signature() != data_signature():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    loaded_data_signature()
+
 recipes = load_recipes()
 
-if not items or not recipes:
+if not recipes:
     st.error("Failed to load local data files.")
     st.stop()
 
 # Build craftable list
-craftable_items = sorted({
-    out["entity"]["name"]
-    for r in recipes.values()
-    for out in r.get("outputs", [])
-})
+craftable_items = craftable_names()
 
 choice = st.selectbox(
     "Choose an item to craft:",
@@ -319,7 +512,13 @@ choice = st.selectbox(
 )
 
 if choice:
-    item_data = get_item_by_name(choice, items)
+    # Item files are only needed once something is selected
+    items = load_items()
+    if not items:
+        st.error("Failed to load local data files.")
+        st.stop()
+
+    item_data = get_item_by_name(choice)
 
     if item_data:
         with st.container(border=True):
@@ -340,41 +539,43 @@ if choice:
 number_to_craft = st.slider("How many to craft?", 1, 100, 1)
 
 if choice:
-    # Find internal ID
-    target_id = None
-    for r in recipes.values():
-        for out in r["outputs"]:
-            if out["entity"]["name"] == choice:
-                target_id = out["entity"]["id"]
+    # Reruns that leave the selection (and data) unchanged reuse the last tables
+    result_key = (loaded_data_signature(), choice, number_to_craft)
+    if st.session_state.get("_last_result_key") == result_key:
+        df_raw, df_craft, tree = st.session_state["_last_result"]
+    else:
+        # Find internal ID
+        target_id = output_name_index().get(choice)
+
+        raw, craftables = walk(target_id, needed=number_to_craft)
+        tree = render_tree(target_id)
+
+        # Raw materials
+        raw_qty = pd.Series(raw, dtype="int64")
+        df_raw = (
+            item_display_table().loc[raw_qty.index]
+            .assign(Quantity=raw_qty)
+            .sort_values("Item")
+        )
+
+        # Craftable components
+        craft_qty = pd.Series(craftables, dtype="int64")
+        df_craft = (
+            item_display_table().loc[craft_qty.index]
+            .assign(Quantity=craft_qty)
+            .join(crafting_info_table())
+            .infer_objects()
+            .sort_values("Item")
+        )
 
-    # Raw materials
-    raw = resolve(target_id, items, recipes, needed=number_to_craft)
-    raw_pretty = prettify_breakdown(raw, items)
+        st.session_state["_last_result_key"] = result_key
+        st.session_state["_last_result"] = (df_raw, df_craft, tree)
 
     st.subheader("🪨 Raw Materials Needed")
-    df_raw = pd.DataFrame([
-        {"Item": name, "Quantity": qty * number_to_craft}
-        for name, qty in raw_pretty.items()
-    ])
     st.dataframe(df_raw, hide_index=True)
 
-    # Craftable components
-    craftables = resolve_craftables(target_id, items, recipes, needed=number_to_craft)
-    craft_rows = []
-    for item_id, qty in craftables.items():
-        info = get_recipe_crafting_info(item_id, recipes)
-        display_name = f"{get_item_emoji(items[item_id])} {items[item_id]['name']}"
-
-        craft_rows.append({
-            "Item": display_name,
-            "Quantity": qty * number_to_craft,
-            "Skill": info["skill"],
-            "Required Level": info["level"]
-        })
-
     st.subheader("⚒️ Intermediate Crafting")
-    df_craft = pd.DataFrame(craft_rows)
     st.dataframe(df_craft, hide_index=True)
 
     st.subheader("🌳 Crafting Tree")
-    st.code(render_tree(target_id, recipes))
+    st.code(tree)
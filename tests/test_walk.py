@@ -0,0 +1,100 @@
+import importlib
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(monkeypatch):
+    # The app reads data/ relative to the working directory on import
+    monkeypatch.chdir(ROOT)
+    monkeypatch.syspath_prepend(ROOT)
+    return importlib.import_module("streamlit_app")
+
+
+@pytest.fixture
+def recipes(app, monkeypatch):
+    """Swap in a synthetic {item_id: (output_stack, ingredients)} graph."""
+    graph = {}
+    monkeypatch.setattr(app, "ingredient_graph", lambda: graph)
+    monkeypatch.setattr(app, "terminal_item_ids", lambda: frozenset())
+    app.build_graph.clear()
+    app.walk.clear()
+    yield graph
+    app.build_graph.clear()
+    app.walk.clear()
+
+
+def test_root_on_a_loop_keeps_its_sub_recipe(app, recipes):
+    recipes.update({
+        "A": (1, (("B", 1), ("X", 1))),
+        "B": (1, (("A", 1), ("X", 1))),
+    })
+    assert app.walk("B", 1) == ({"X": 2}, {"A": 1})
+    assert app.walk("A", 1) == ({"X": 2}, {"B": 1})
+
+
+def test_chain_below_a_loop_is_fully_resolved(app, recipes):
+    # D is indexed before C, although C is made from D
+    recipes.update({
+        "A": (1, (("B", 1),)),
+        "B": (1, (("A", 1), ("C", 1))),
+        "D": (1, (("E", 1),)),
+        "C": (1, (("D", 1),)),
+    })
+    assert app.walk("A", 1) == ({"E": 1}, {"B": 1, "C": 1, "D": 1})
+
+
+def test_shared_sub_recipe_is_rounded_once(app, recipes):
+    # Bars come two per craft; nails and hinges each need one
+    recipes.update({
+        "door": (1, (("nail", 1), ("hinge", 1))),
+        "nail": (1, (("bar", 1),)),
+        "hinge": (1, (("bar", 1),)),
+        "bar": (2, (("ore", 3),)),
+    })
+    raw, craftables = app.walk("door", 1)
+    assert raw == {"ore": 3}
+    assert craftables == {"nail": 1, "hinge": 1, "bar": 1}
+
+
+def test_quantities_scale_with_needed(app, recipes):
+    recipes.update({
+        "plank": (2, (("log", 1),)),
+        "shelf": (1, (("plank", 3), ("nail", 2))),
+    })
+    assert app.walk("shelf", 1) == ({"log": 2, "nail": 2}, {"plank": 2})
+    assert app.walk("shelf", 7) == ({"log": 11, "nail": 14}, {"plank": 11})
+
+
+def test_deeper_intermediates_use_pooled_counts(app, recipes):
+    # Ingots are used directly and again inside the sheet
+    recipes.update({
+        "maul": (1, (("sheet", 1), ("ingot", 2))),
+        "sheet": (1, (("ingot", 3),)),
+        "ingot": (1, (("ore", 2),)),
+    })
+    raw, craftables = app.walk("maul", 1)
+    assert raw == {"ore": 10}
+    assert craftables == {"sheet": 1, "ingot": 5}
+
+
+def test_tables_show_walk_quantities_once(app):
+    from streamlit.testing.v1 import AppTest
+
+    name = "Aegis Potion III"
+    at = AppTest.from_file(os.path.join(ROOT, "streamlit_app.py"), default_timeout=60)
+    at.run()
+    at.selectbox[0].select(name)
+    at.slider[0].set_value(7)
+    at.run()
+    assert not at.exception
+
+    raw, craftables = app.walk(app.output_name_index()[name], 7)
+    df_raw, df_craft = (element.value for element in at.dataframe)
+    assert sorted(df_raw["Quantity"]) == sorted(raw.values())
+    assert sorted(df_craft["Quantity"]) == sorted(craftables.values())
+    assert list(df_raw["Item"]) == sorted(df_raw["Item"])
+    assert list(df_craft["Item"]) == sorted(df_craft["Item"])